@@ -4,10 +4,62 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 import re
 import time
 
 
+# Regular expressions used to parse the scraped texts, compiled once instead of on every product and review
+RE_RATING = re.compile(r'(\d+(?:\.\d+)?) out of 5 stars')
+RE_REVIEWS = re.compile(r'(\d+) reviews')
+RE_STOCK_NUM = re.compile(r'(\d+)')
+RE_SKU_PREFIX = re.compile(r"SKU:\s*")
+RE_REVIEWER = re.compile(r'By (.+?) on')
+RE_DATE = re.compile(r'on (\d{1,2}/\d{1,2}/\d{4})')
+
+# JavaScript that collects the texts of every review on a product page in one WebDriver call,
+# instead of several find_element calls per review. The date is the review's last <p>, when it has more than one.
+REVIEWS_JS = """
+const text = (el) => el ? el.innerText.trim() : null;
+return Array.from(document.querySelectorAll('div.border-b.border-gray-200.pb-8'), (review) => {
+    const paragraphs = review.querySelectorAll('p');
+    return {
+        reviewerInfo: text(review.querySelector('p[class="text-sm text-gray-500"]')),
+        stars: review.querySelectorAll('svg.text-yellow-400').length,
+        title: text(review.querySelector('p[class="ml-3 text-sm font-medium text-gray-900"]')),
+        dateText: paragraphs.length > 1 ? text(paragraphs[paragraphs.length - 1]) : null,
+        body: text(review.querySelector('p.text-base.text-gray-900')),
+        checksum: text(review.querySelector('code.text-xs.font-mono'))
+    };
+});
+"""
+
+
+def review_row(reviewID, review):
+    """Turn the raw texts of one review collected by REVIEWS_JS into its output dictionary."""
+    review_data = {}  # Dictionary to store individual review data
+    review_data["Review ID"] = reviewID
+
+    # Extract reviewer name
+    name_match = RE_REVIEWER.search(review["reviewerInfo"] or "")
+    review_data["Reviewer Name"] = name_match.group(1) if name_match else "N/A"
+
+    # The number of yellow stars is the rating
+    review_data["Rating"] = f"{review['stars']}/5 Stars"
+
+    # Review title, taken from this review rather than the first one on the page
+    review_data["Review Title"] = review["title"] or "N/A"
+
+    # Extract the review date
+    date_match = RE_DATE.search(review["dateText"] or "")
+    review_data["Review Date"] = date_match.group(1) if date_match else "N/A"
+
+    # Review body text and checksum, if available
+    review_data["Review Body"] = review["body"] or "N/A"
+    review_data["Review Checksum"] = review["checksum"] or "N/A"
+
+    return review_data
+
 
 # List to store all the scraped product data
 data = []
@@ -22,7 +74,12 @@ while True:
     # Construct URL for the current page
     url = f"https://hiring-xry4.onrender.com/products?page={current_page}"
     driver.get(url)
-    time.sleep(2)  # Wait for the page to load
+
+    # Wait for the product links to appear; if none show up, there are no more pages to scrape
+    try:
+        WebDriverWait(driver, 10, poll_frequency=0.05).until(EC.presence_of_element_located((By.XPATH, "//a[@class='group']")))
+    except TimeoutException:
+        break
 
     # Get all product links on the current page
     product_links = driver.find_elements(By.XPATH, "//a[@class='group']")
@@ -39,7 +96,8 @@ while True:
         row = {}  # Dictionary to store data for the current product
         driver.get(url)  # Navigate to the product page
         print(f"Scraping details from: {url}")
-        time.sleep(2)  # Wait for the page to load
+        # Wait for the product title to load instead of sleeping a fixed amount of time
+        WebDriverWait(driver, 10, poll_frequency=0.05).until(EC.presence_of_element_located((By.XPATH, "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]")))
         
         # Scrape product title
         row["Product Title"] = driver.find_element(By.XPATH, "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]").text
@@ -55,9 +113,10 @@ while True:
         # Scrape overall product rating and review count
         overall_rating_element = driver.find_element(By.XPATH, "//div[@class='flex items-center']/p[@class='ml-3 text-sm text-gray-700']")
         overall_rating_text = overall_rating_element.text
-        overall_rating_match = re.search(r'(\d+(\.\d+)?) out of 5 stars', overall_rating_text)
+        overall_rating_match = RE_RATING.search(overall_rating_text)
         row["Overall Rating"] = f"{overall_rating_match.group(1)}/5 Stars" if overall_rating_match else "N/A"
-        row["Total Reviews"] = int(re.search(r'(\d+) reviews', overall_rating_text).group(1)) if re.search(r'(\d+) reviews', overall_rating_text) else "N/A"
+        total_reviews_match = RE_REVIEWS.search(overall_rating_text)
+        row["Total Reviews"] = int(total_reviews_match.group(1)) if total_reviews_match else "N/A"
         
         # Scrape stock status and availability
         row["Stock Status"] = driver.find_element(By.XPATH, "//div[contains(@class, 'inline-flex items-center') and (contains(text(), 'In stock') or contains(text(), 'Out of stock'))]").text
@@ -68,65 +127,26 @@ while True:
             row["Stock Available"] = 0
         elif "In stock" in stock_status_text:
             text = driver.find_element(By.XPATH, "//p[@class='ml-2 text-sm text-gray-500']").text
-            number = int(re.search(r'(\d+)', text).group(1))
+            number = int(RE_STOCK_NUM.search(text).group(1))
             row["Stock Available"] = number
         else:
             row["Stock Available"] = "N/A"  # Fallback for missing data
 
         # Scrape SKU (Stock Keeping Unit)
         sku_text = driver.find_element(By.XPATH, "//p[@class='text-sm text-gray-500']").text
-        row["SKU"] = re.sub(r"SKU:\s*", "", sku_text)  # Remove the "SKU:" prefix
+        row["SKU"] = RE_SKU_PREFIX.sub("", sku_text)  # Remove the "SKU:" prefix
         
         # Scrape product checksum if available
         product_checksum = driver.find_element(By.XPATH, ".//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]").text if driver.find_elements(By.XPATH, ".//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]") else "N/A"
         row["Product Checksum"] = product_checksum
 
         ############
-        reviews = []  # List to store review data for the current product
-        review_elements = driver.find_elements(By.CSS_SELECTOR, 'div.border-b.border-gray-200.pb-8')  # Locate reviews on the product page
-
-        reviewID = 0  # Initialize unique ID counter for reviews
-        # Loop through all reviews for the current product
-        for review in review_elements:
-            review_data = {}  # Dictionary to store individual review data
-
-            try:
-                reviewID += 1
-                review_data["Review ID"] = reviewID
-
-                # Extract reviewer name and date
-                reviewer_info = review.find_element(By.XPATH, ".//p[@class='text-sm text-gray-500']").text
-                name_match = re.search(r'By (.+?) on', reviewer_info)
-                review_data["Reviewer Name"] = name_match.group(1) if name_match else "N/A"
-
-                # Count the number of yellow stars (rating)
-                yellow_stars = review.find_elements(By.CSS_SELECTOR, 'svg.text-yellow-400')
-                num_stars = len(yellow_stars)
-                review_data["Rating"] = f"{num_stars}/5 Stars"
-                
-                # Extract review title
-                review_title = driver.find_element(By.XPATH, "//p[@class='ml-3 text-sm font-medium text-gray-900']").text
-                review_data["Review Title"] = review_title
-
-                # Try to extract the review date
-                review_p_elements = review.find_elements(By.XPATH, ".//p")
-                if len(review_p_elements) > 1:
-                    review_date_text = review_p_elements[-1].text  # Assume the last <p> contains the date
-                    match = re.search(r'on (\d{1,2}/\d{1,2}/\d{4})', review_date_text)
-                    review_data["Review Date"] = match.group(1) if match else "N/A"
-                else:
-                    review_data["Review Date"] = "N/A"
-
-                # Extract the review body text
-                review_data["Review Body"] = review.find_element(By.XPATH, ".//p[contains(@class, 'text-base') and contains(@class, 'text-gray-900')]").text if len(review.find_elements(By.XPATH, ".//p[contains(@class, 'text-base') and contains(@class, 'text-gray-900')]")) > 0 else "N/A"
-
-                # Extract review checksum if available
-                review_data["Review Checksum"] = review.find_element(By.XPATH, ".//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]").text if review.find_elements(By.XPATH, ".//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]") else "N/A"
-
-            except Exception as e:
-                print(f"Error processing review: {e}")  # Log any error encountered while scraping reviews
-
-            reviews.append(review_data)
+        raw_reviews = driver.execute_script(REVIEWS_JS)  # Collect the texts of all reviews on the product page at once
+        # The review count is known up front, so allocate the whole list once and fill it by index;
+        # review IDs follow the order of the reviews on the page
+        reviews = [None] * len(raw_reviews)
+        for index, review in enumerate(raw_reviews):
+            reviews[index] = review_row(index + 1, review)
 
         # Add the reviews data to the product row
         row["Customer Reviews"] = reviews
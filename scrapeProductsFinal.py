@@ -1,9 +1,15 @@
-import json
+import os
 import re
 import time
 import logging
+import shutil
 import sys
+import tempfile
 import traceback
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 
 from selenium import webdriver
@@ -11,6 +17,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import (
     WebDriverException,
     NoSuchElementException,
@@ -19,18 +26,135 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import requests
+import lxml.html
+from lxml import etree
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class ScraperError(Exception):
     """Custom exception for scraping related errors."""
     pass
 
-def setup_webdriver(headless: bool = True, max_retries: int = 3):
+class ProductNotFoundError(ScraperError):
+    """Raised when the site reports that a product page does not exist."""
+    pass
+
+# Product page URL, formatted with the product ID
+PRODUCT_URL = "https://hiring-xry4.onrender.com/products/{}"
+
+# Resolved chromedriver path, cached so webdriver_manager is only consulted once per process
+_DRIVER_PATH = None
+
+# Seconds to wait for fields that may legitimately be missing from a product page
+OPTIONAL_FIELD_TIMEOUT = 2
+
+# Seconds between checks while waiting for an element (WebDriverWait polls every 0.5s by default)
+WAIT_POLL_FREQUENCY = 0.05
+
+# Outcomes of safe_find_element / safe_find_elements lookups on the current page, keyed by
+# (driver, locator strategy, locator value). Threads borrow browsers from the DriverPool in turn, so an entry is only
+# valid for the page its thread loaded: scrape_product calls clear_element_cache() after every driver.get().
+_lookup_caches = threading.local()
+
+# Regular expressions used to parse the scraped texts, compiled once at import
+_RE_RATING = re.compile(r'(\d+(?:\.\d+)?) out of 5 stars')
+_RE_REVIEWS = re.compile(r'(\d+) reviews')
+_RE_STOCK_NUM = re.compile(r'(\d+)')
+_RE_REVIEWER = re.compile(r'By (.+?) on')
+_RE_DATE = re.compile(r'on (\d{1,2}/\d{1,2}/\d{4})')
+
+# Locators of the product page elements used by the WebDriver lookups
+TITLE_SELECTOR = "h1.text-3xl.font-bold"
+PRICE_SELECTOR = "p.text-3xl.tracking-tight.text-gray-900"
+CATEGORY_SELECTOR = "a.bg-primary-100.text-primary-800"
+IMAGE_SELECTOR = "img[class='h-full w-full object-cover object-center']"
+DESCRIPTION_SELECTOR = "p[class='text-base text-gray-700']"
+RATING_SELECTOR = "div[class='flex items-center'] > p[class='ml-3 text-sm text-gray-700']"
+STOCK_STATUS_XPATH = "//div[contains(@class, 'inline-flex items-center') and text()[contains(., 'In stock') or contains(., 'Out of stock')]]"  # XPath: matches on text
+STOCK_QUANTITY_SELECTOR = "p.ml-2.text-sm.text-gray-500"
+SKU_SELECTOR = "p[class='text-sm text-gray-500']"
+CHECKSUM_SELECTOR = "code.text-xs.font-mono"
+
+# Keep-alive HTTP session used to fetch product pages without a browser
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# JavaScript shared by the in-page extraction scripts: a text helper and an expression that
+# collects the raw texts of every review on the page
+_TEXT_JS = """
+const text = (el) => el ? el.innerText.trim() : null;
+"""
+_REVIEWS_EXPR_JS = """Array.from(document.querySelectorAll('div.border-b.border-gray-200.pb-8'), (review) => {
+    const paragraphs = review.querySelectorAll('p');
+    return {
+        reviewerInfo: text(review.querySelector('p[class="text-sm text-gray-500"]')),
+        stars: review.querySelectorAll('svg.text-yellow-400').length,
+        title: text(review.querySelector('p[class="ml-3 text-sm font-medium text-gray-900"]')),
+        dateText: paragraphs.length > 1 ? text(paragraphs[paragraphs.length - 1]) : null,
+        body: text(review.querySelector('p.text-base.text-gray-900')),
+        checksum: text(review.querySelector('code.text-xs.font-mono'))
+    };
+})"""
+
+# JavaScript run in the product page to collect every review in one WebDriver round-trip
+REVIEWS_JS = _TEXT_JS + "return " + _REVIEWS_EXPR_JS + ";"
+
+# JavaScript run in the product page to collect every field in one WebDriver round-trip.
+# The selectors mirror the *_SELECTOR / *_XPATH locators used by the field-by-field extraction.
+HARVEST_JS = _TEXT_JS + """
+const stockStatus = Array.from(document.querySelectorAll('div[class*="inline-flex items-center"]')).find(
+    (div) => Array.from(div.childNodes).some(
+        (node) => node.nodeType === Node.TEXT_NODE && /In stock|Out of stock/.test(node.textContent)
+    )
+);
+return {
+    title: text(document.querySelector('h1.text-3xl.font-bold')),
+    price: text(document.querySelector('p.text-3xl.tracking-tight.text-gray-900')),
+    categories: Array.from(document.querySelectorAll('a.bg-primary-100.text-primary-800'), text),
+    images: Array.from(document.querySelectorAll('img[class="h-full w-full object-cover object-center"]'), (img) => img.src),
+    description: text(document.querySelector('p[class="text-base text-gray-700"]')),
+    rating: text(document.querySelector('div[class="flex items-center"] > p[class="ml-3 text-sm text-gray-700"]')),
+    stockStatus: text(stockStatus),
+    stockQuantity: text(document.querySelector('p.ml-2.text-sm.text-gray-500')),
+    sku: text(document.querySelector('p[class="text-sm text-gray-500"]')),
+    checksum: text(document.querySelector('code.text-xs.font-mono')),
+    reviews: """ + _REVIEWS_EXPR_JS + """
+};
+"""
+
+def get_driver_path():
+    """
+    Return the path of the chromedriver binary, resolving it only once per process.
+
+    The WEBDRIVER_PATH environment variable is used when it points to an existing file; otherwise the driver
+    is located (and downloaded if needed) with webdriver_manager.
+
+    Returns:
+        str: Path of the chromedriver binary
+    """
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        env_path = os.environ.get('WEBDRIVER_PATH')
+        if env_path and os.path.isfile(env_path):
+            _DRIVER_PATH = env_path  # Use the preinstalled driver and skip webdriver_manager entirely
+        else:
+            _DRIVER_PATH = ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+
+def setup_webdriver(headless: bool = True, max_retries: int = 3, profile_dir: Optional[str] = None):
     """
     Set up and return a Selenium WebDriver instance with retry mechanism.
 
     Args:
         headless (bool): Whether to run the browser in headless mode. Defaults to True.
         max_retries (int): Maximum number of retry attempts for WebDriver setup.
+        profile_dir (Optional[str]): Chrome user data directory to keep the browser's profile and disk cache in. Defaults
+            to a fresh temporary profile. No two running browsers may use the same directory.
 
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver
@@ -38,14 +162,29 @@ def setup_webdriver(headless: bool = True, max_retries: int = 3):
     Raises:
         ScraperError: If WebDriver setup fails after max retries
     """
+    # The options don't change between attempts, so build them once
+    options = Options()  # Create an instance of the Chrome options
+    if headless:
+        options.add_argument('--headless')  # Run in headless mode (no UI)
+
+    # Return from driver.get() once the DOM is ready instead of waiting for every subresource
+    options.page_load_strategy = 'eager'
+    # Only image URLs are scraped, so skip downloading and decoding the images themselves
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')  # Skip the sandbox process startup (also required when running as root in containers)
+    # Stylesheets are still loaded: .text only reports rendered text, so unstyled pages would change the scraped values
+    if profile_dir:
+        # Keep the profile, and with it a 100MB HTTP disk cache of the site's scripts, styles and fonts, between browsers.
+        # DNS and TLS session caches live in memory only, so those still start cold.
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        options.add_argument('--disk-cache-size=104857600')
+
     for attempt in range(max_retries):  # Loop to retry WebDriver setup
         try:
-            options = Options()  # Create an instance of the Chrome options
-            if headless:
-                options.add_argument('--headless')  # Run in headless mode (no UI)
-
             # Initialize the WebDriver with the specified options
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
 
             # Set a page load timeout to avoid long waiting times
             driver.set_page_load_timeout(30)
@@ -64,15 +203,22 @@ def setup_webdriver(headless: bool = True, max_retries: int = 3):
             # Wait for a short period before retrying
             time.sleep(2)  
 
-def safe_find_element(driver: webdriver.Chrome, by: By, value: str, timeout: int = 10):
+def safe_find_element(driver: webdriver.Chrome, by: By, value: str, timeout: float = OPTIONAL_FIELD_TIMEOUT,
+                      poll: float = WAIT_POLL_FREQUENCY, max_retries: int = 3, quiet: bool = False):
     """
     Safely find an element with error handling and logging.
 
+    Lookups made directly on a WebDriver are cached until the next clear_element_cache() call, so a field that
+    was already found (or already timed out) on the current page is not waited for again.
+
     Args:
         driver (webdriver.Chrome): Selenium WebDriver instance used to interact with the browser.
         by (By): Selenium By locator strategy to identify the element.
         value (str): Locator value to find the element.
-        timeout (int): Maximum time (in seconds) to wait for the element to appear on the page. Defaults to 10 seconds.
+        timeout (float): Maximum time (in seconds) to wait for the element to appear on the page. Defaults to OPTIONAL_FIELD_TIMEOUT.
+        poll (float): Seconds between checks while waiting. Defaults to WAIT_POLL_FREQUENCY.
+        max_retries (int): Maximum number of attempts if the element goes stale while it is being found.
+        quiet (bool): Don't log a warning when the element is not found, for fields that are expected to be missing at times.
 
     Returns:
         Optional[Any]: The found WebElement, or None if the element is not found within the timeout.
@@ -80,32 +226,63 @@ def safe_find_element(driver: webdriver.Chrome, by: By, value: str, timeout: int
     Raises:
         ScraperError: If an unexpected error occurs while trying to find the element.
     """
-    try:
-        # Wait for the element to be present in the DOM
-        element = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+    # Only page-wide lookups are cached; lookups scoped to an element (e.g. a review) are not
+    cache_key = (id(driver), str(by), value) if isinstance(driver, WebDriver) else None
+    element_cache = _element_caches()[0]
+    if cache_key in element_cache:
+        return element_cache[cache_key]
+
+    for attempt in range(max_retries):  # Loop to retry the lookup if the element goes stale
+        try:
+            # Wait for the element to be present in the DOM
+            element = WebDriverWait(driver, timeout, poll_frequency=poll).until(EC.presence_of_element_located((by, value)))
+
+        except (TimeoutException, NoSuchElementException):  # Element is not found
+            # Log a warning (unless the caller expects misses) and return None if the element is not found
+            if not quiet:
+                logging.warning(f"Element not found: {by}={value}")
+            element = None
+
+        except StaleElementReferenceException:  # Handle case when element is no longer attached to the DOM
+            # Log a warning and retry in case the element becomes stale (e.g., due to dynamic content changes)
+            logging.warning(f"Stale element encountered: {by}={value}. Retrying...")
+            time.sleep(0.05 * 2 ** attempt)  # Back off exponentially from 50ms before retrying
+            continue
+
+        except Exception as e:  # Handle any other unexpected exceptions
+            # Log the error and raise a custom exception if an unexpected error occurs
+            logging.error(f"Unexpected error finding element {by}={value}: {e}")
+            raise ScraperError(f"Failed to find element: {e}")
+
+        if cache_key is not None:
+            element_cache[cache_key] = element  # Remember the outcome, including "not found"
         return element  # Return the element if found
 
-    except NoSuchElementException:  # Element is not found
-        # Log a warning and return None if the element is not found
-        logging.warning(f"Element not found: {by}={value}")
-        return None
+    # The element kept going stale; give up without caching so a later lookup can try again
+    logging.warning(f"Element still stale after {max_retries} attempts: {by}={value}")
+    return None
+
+
+def _element_caches():
+    """Return the current thread's (safe_find_element, safe_find_elements) lookup caches."""
+    if not hasattr(_lookup_caches, 'element'):
+        _lookup_caches.element = {}
+        _lookup_caches.elements = {}
+    return _lookup_caches.element, _lookup_caches.elements
 
-    except StaleElementReferenceException:  # Handle case when element is no longer attached to the DOM
-        # Log a warning and retry in case the element becomes stale (e.g., due to dynamic content changes)
-        logging.warning(f"Stale element encountered: {by}={value}. Retrying...")
-        time.sleep(1)  # Brief pause before retrying
-        return safe_find_element(driver, by, value, timeout)  # Recursively retry to find the element
 
-    except Exception as e:  # Handle any other unexpected exceptions
-        # Log the error and raise a custom exception if an unexpected error occurs
-        logging.error(f"Unexpected error finding element {by}={value}: {e}")
-        raise ScraperError(f"Failed to find element: {e}")
+def clear_element_cache():
+    """Forget the element lookups cached by safe_find_element and safe_find_elements. Call this after every page load."""
+    for cache in _element_caches():
+        cache.clear()
 
 
 def safe_find_elements(driver: webdriver.Chrome, by: By, value: str) -> List[Any]:
     """
     Safely find multiple elements with error handling and logging.
 
+    Like safe_find_element, lookups made directly on a WebDriver are cached until the next clear_element_cache() call.
+
     Args:
         driver (webdriver.Chrome): Selenium WebDriver instance used to interact with the browser.
         by (By): Selenium By locator strategy to identify the elements.
@@ -114,288 +291,634 @@ def safe_find_elements(driver: webdriver.Chrome, by: By, value: str) -> List[Any
     Returns:
         List[Any]: List of WebELements found, or an empty list if an error occurs.
     """
+    # Only page-wide lookups are cached; lookups scoped to an element (e.g. a review) are not
+    cache_key = (id(driver), str(by), value) if isinstance(driver, WebDriver) else None
+    elements_cache = _element_caches()[1]
+    if cache_key in elements_cache:
+        return elements_cache[cache_key]
+
     try:
         # Attempt to find the elements using the provided locator strategy and value
         elements = driver.find_elements(by, value)
-        return elements  # Return the list of found elements
 
     except Exception as e:  # Catch any unexpected exceptions
         # Log the error and return an empty list if elements cannot be found
         logging.error(f"Error finding elements {by}={value}: {e}")
         return []  # Return an empty list if there's an error
 
+    if cache_key is not None:
+        elements_cache[cache_key] = elements  # WebElements stay valid until the next page load
+    return elements  # Return the list of found elements
 
-def extract_overall_rating(rating_element: Optional[Any]):
+
+def text_or(driver: webdriver.Chrome, by: By, value: str, default: Optional[str], timeout: float = OPTIONAL_FIELD_TIMEOUT):
     """
-    Extract overall product rating and total reviews with robust error handling.
+    Look up an optional element once and return its text, or a fallback value.
 
     Args:
-        rating_element (Optional[Any]): The rating element from the webpage containing rating and reviews data.
+        driver (webdriver.Chrome): Active Selenium WebDriver instance.
+        by (By): Locator strategy.
+        value (str): Locator value.
+        default (Optional[str]): Value returned when the element is not found.
+        timeout (float): Maximum wait time for the element.
+
+    Returns:
+        Optional[str]: The element's text, or the default.
+    """
+    element = safe_find_element(driver, by, value, timeout=timeout, quiet=True)  # The default covers a miss
+    return element.text if element else default
+
+
+def parse_overall_rating(rating_text: Optional[str]):
+    """
+    Parse the overall product rating and total reviews out of the rating text.
+
+    Args:
+        rating_text (Optional[str]): Text of the rating element, e.g. '4.2 out of 5 stars (12 reviews)'.
 
     Returns:
         tuple: A tuple containing:
             - overall rating (str): Rating formatted as 'x/5 Stars', or 'N/A' if not available.
-            - total reviews (int or str): Total number of reviews, or 'N/A' if not available or an error occurs.
+            - total reviews (int or str): Total number of reviews, or 'N/A' if not available.
     """
-    # If the rating element is not provided or is invalid, return "N/A" for both values
-    if not rating_element:
+    # If there is no rating text, return "N/A" for both values
+    if not rating_text:
         return "N/A", "N/A"
 
-    try:
-        # Extract the text content of the rating element
-        rating_text = rating_element.text
-        
-        # Use regular expressions to search for the rating and review count
-        overall_rating_match = re.search(r'(\d+(\.\d+)?) out of 5 stars', rating_text)
-        total_reviews_match = re.search(r'(\d+) reviews', rating_text)
+    # Use regular expressions to search for the rating and review count
+    overall_rating_match = _RE_RATING.search(rating_text)
+    total_reviews_match = _RE_REVIEWS.search(rating_text)
 
-        # Extract and format the overall rating if a match is found
-        overall_rating = f"{overall_rating_match.group(1)}/5 Stars" if overall_rating_match else "N/A"
-        
-        # Extract the total reviews count if a match is found and convert to an integer
-        total_reviews = int(total_reviews_match.group(1)) if total_reviews_match else "N/A"
+    # Extract and format the overall rating if a match is found
+    overall_rating = f"{overall_rating_match.group(1)}/5 Stars" if overall_rating_match else "N/A"
 
-        return overall_rating, total_reviews  # Return the extracted data
+    # Extract the total reviews count if a match is found and convert to an integer
+    total_reviews = int(total_reviews_match.group(1)) if total_reviews_match else "N/A"
 
-    except Exception as e:  # Catch any unexpected errors that may arise during extraction
-        # Log the error and return "N/A" for both values
-        logging.error(f"Error extracting rating: {e}")
-        return "N/A", "N/A"  # Return "N/A" in case of error to avoid crashing the program
+    return overall_rating, total_reviews  # Return the extracted data
 
 
-def extract_stock_availability(driver: webdriver.Chrome):
+def parse_stock_availability(stock_status_text: Optional[str], stock_text: Optional[str]):
     """
-    Extract stock status and available stock quantity with comprehensive error handling.
+    Work out the available stock quantity from the stock status and quantity texts.
+
+    Args:
+        stock_status_text (Optional[str]): Text of the stock status element ("In stock" or "Out of stock").
+        stock_text (Optional[str]): Text of the element holding the in-stock quantity, if any.
+
+    Returns:
+        int or str: Returns the number of items in stock, '0' for out-of-stock items, 'N/A' if the status is missing or unrecognized, or 'Unspecified Stock' if stock quantity is unclear.
+    """
+    # If there is no stock status, return "N/A"
+    if not stock_status_text:
+        return "N/A"
+
+    # Check if the item is out of stock
+    if "Out of stock" in stock_status_text:
+        return 0  # Return 0 if the item is out of stock
+    elif "In stock" in stock_status_text:
+        # If the quantity text is not available, return "Unspecified Stock"
+        if not stock_text:
+            return "Unspecified Stock"
+
+        stock_match = _RE_STOCK_NUM.search(stock_text)
+
+        # Return the stock quantity if a match is found, otherwise return "Unspecified Stock"
+        return int(stock_match.group(1)) if stock_match else "Unspecified Stock"
+    else:
+        return "N/A"  # Return "N/A" if the stock status text is unrecognized
+
+
+def extract_stock_availability(driver: webdriver.Chrome, stock_status_text: Optional[str]):
+    """
+    Extract the available stock quantity for an already scraped stock status with comprehensive error handling.
 
     Args:
         driver (webdriver.Chrome): Active Selenium WebDriver instance used for interacting with the webpage.
+        stock_status_text (Optional[str]): Text of the stock status element ("In stock" or "Out of stock"), or None if it was not found.
 
     Returns:
         int or str: Returns the number of items in stock, '0' for out-of-stock items, 'N/A' if unable to extract data, or 'Unspecified Stock' if stock quantity is unclear.
     """
     try:
-        # Find the element containing stock status (either "In stock" or "Out of stock")
-        stock_status_element = safe_find_element(
-            driver,
-            By.XPATH,
-            "//div[contains(@class, 'inline-flex items-center') and (contains(text(), 'In stock') or contains(text(), 'Out of stock'))]"
-        )
-
-        # If no stock status element is found, return "N/A"
-        if not stock_status_element:
+        # If no stock status element was found, return "N/A"
+        if not stock_status_text:
             return "N/A"
 
-        stock_status_text = stock_status_element.text
+        stock_text = None
 
-        # Check if the item is out of stock
-        if "Out of stock" in stock_status_text:
-            return 0  # Return 0 if the item is out of stock
-        elif "In stock" in stock_status_text:
+        # Only in-stock items have a quantity element worth looking up
+        if "In stock" in stock_status_text:
             # Find the element containing the quantity of in-stock items
             stock_text_element = safe_find_element(
                 driver,
-                By.XPATH,
-                "//p[contains(@class, 'ml-2') and contains(@class, 'text-sm') and contains(@class, 'text-gray-500')]"
+                By.CSS_SELECTOR,
+                STOCK_QUANTITY_SELECTOR,
+                timeout=1,  # The stock status is already on the page, so the quantity is too if it exists
+                quiet=True
             )
+            stock_text = stock_text_element.text if stock_text_element else None
 
-            # If the quantity element is not found, return "Unspecified Stock"
-            if not stock_text_element:
-                return "Unspecified Stock"
-
-            stock_text = stock_text_element.text
-            stock_match = re.search(r'(\d+)', stock_text)
-
-            # Return the stock quantity if a match is found, otherwise return "Unspecified Stock"
-            return int(stock_match.group(1)) if stock_match else "Unspecified Stock"
-        else:
-            return "N/A"  # Return "N/A" if the stock status text is unrecognized
+        return parse_stock_availability(stock_status_text, stock_text)
     except Exception as e:
         # Log any errors encountered during the extraction process
         logging.error(f"Comprehensive error in stock availability extraction: {e}")
         return "N/A"  # Return "N/A" in case of an error to prevent failure
 
+
+def build_review(review_id: int, reviewer_info: Optional[str], stars: int, title: Optional[str],
+                 date_text: Optional[str], body: Optional[str], checksum: Optional[str]):
+    """
+    Build the review dictionary from the raw texts of a single review.
+
+    Args:
+        review_id (int): Position of the review on the page, starting at 1.
+        reviewer_info (Optional[str]): Text holding the reviewer's name, e.g. 'By Jane Doe on 1/2/2024'.
+        stars (int): Number of highlighted rating stars.
+        title (Optional[str]): Review title text.
+        date_text (Optional[str]): Text holding the review date.
+        body (Optional[str]): Review body text.
+        checksum (Optional[str]): Review checksum text.
+
+    Returns:
+        Dict[str, Any]: Review details such as ID, name, rating, title, date, body, and checksum.
+    """
+    review_data = {}  # Initialize a dictionary to store data for the review
+    review_data["Review ID"] = review_id
+
+    # Extract reviewer's name
+    name_match = _RE_REVIEWER.search(reviewer_info or "Unknown")
+    review_data["Name"] = name_match.group(1) if name_match else "Anonymous"
+
+    review_data["Rating"] = f"{stars}/5 Stars"  # Rating is determined by the number of star elements
+    review_data["Title"] = title or "Untitled Review"
+
+    # Extract review date
+    match = _RE_DATE.search(date_text or "N/A")
+    review_data["Date"] = match.group(1) if match else "Unknown Date"
+
+    review_data["Review Body"] = body or "No review text"
+    # The checksum has to be read from the page: it doesn't match any common hash (MD5, SHA-1/2/3, BLAKE2) of the review
+    # body, title or other fields, so it can't be computed locally. It comes with the other review texts at no extra cost.
+    review_data["Review Checksum"] = checksum or "No Checksum"  # Unique identifier of the review
+    return review_data
+
+
+def build_reviews(raw_reviews: List[Dict[str, Any]]):
+    """
+    Build the review dictionaries from the raw review texts collected by REVIEWS_JS or parse_product_html.
+
+    Args:
+        raw_reviews (List[Dict[str, Any]]): Raw review texts keyed like the objects returned by REVIEWS_JS.
+
+    Returns:
+        List[Dict[str, Any]]: A list of dictionaries where each dictionary contains review details such as ID, name, rating, title, date, body, and checksum.
+    """
+    # The review count is known up front, so allocate the whole list once and fill it by index;
+    # review IDs follow the order of the reviews on the page
+    reviews = [None] * len(raw_reviews)
+    for index, review in enumerate(raw_reviews):
+        reviews[index] = build_review(index + 1, review["reviewerInfo"], review["stars"], review["title"],
+                                      review["dateText"], review["body"], review["checksum"])
+    return reviews
+
+
 def extract_reviews(driver: webdriver.Chrome):
     """
     Extract customer reviews with advanced error handling and logging.
 
+    All reviews are collected with a single REVIEWS_JS call instead of separate lookups for every field of every review.
+
     Args:
         driver (webdriver.Chrome): Active Selenium WebDriver instance used for interacting with the webpage.
 
     Returns:
         List[Dict[str, Any]]: A list of dictionaries where each dictionary contains review details such as ID, name, rating, title, date, body, and checksum.
     """
-    reviews = []  # List to store all review data
-    reviewID = 0  # Initialize review ID counter
-
     try:
-        # Find all review elements on the page
-        review_elements = safe_find_elements(
-            driver,
-            By.CSS_SELECTOR,
-            'div.border-b.border-gray-200.pb-8'
-        )
+        # Collect the raw texts of all reviews on the page in one round-trip
+        raw_reviews = driver.execute_script(REVIEWS_JS)
 
         # If no reviews are found, log a warning and return an empty list
-        if not review_elements:
+        if not raw_reviews:
             logging.warning("No review elements found")
-            return reviews
+            return []
 
-        # Loop through each review element
-        for review in review_elements:
-            try:
-                review_data = {}  # Initialize a dictionary to store data for each review
-                reviewID += 1  # Increment review ID
-                review_data["Review ID"] = reviewID
+        return build_reviews(raw_reviews)  # Return the list of extracted reviews
 
-                # Extract reviewer's name
-                reviewer_info_element = safe_find_element(review, By.XPATH, ".//p[@class='text-sm text-gray-500']")
-                reviewer_info = reviewer_info_element.text if reviewer_info_element else "Unknown"
-                name_match = re.search(r'By (.+?) on', reviewer_info)
-                review_data["Name"] = name_match.group(1) if name_match else "Anonymous"
+    except Exception as e:
+        # Log any errors that occur during the review extraction process
+        logging.error(f"Comprehensive error in review extraction: {e}")
+        return []  # Return an empty list if extraction fails
 
-                # Extract rating
-                rating_stars = safe_find_elements(review, By.CSS_SELECTOR, 'svg.text-yellow-400')
-                review_data["Rating"] = f"{len(rating_stars)}/5 Stars"  # Rating is determined by the number of star elements
 
-                # Extract review title
-                review_title_element = safe_find_element(review, By.XPATH, ".//p[@class='ml-3 text-sm font-medium text-gray-900']")
-                review_data["Title"] = review_title_element.text if review_title_element else "Untitled Review"
+def build_product(data: Dict[str, Any]):
+    """
+    Build the product dictionary from the raw page texts collected by HARVEST_JS or parse_product_html.
 
-                # Extract review date
-                review_p_elements = safe_find_elements(review, By.XPATH, ".//p")
-                review_date_text = review_p_elements[-1].text if len(review_p_elements) > 1 else "N/A"
-                match = re.search(r'on (\d{1,2}/\d{1,2}/\d{4})', review_date_text)
-                review_data["Date"] = match.group(1) if match else "Unknown Date"
+    Args:
+        data (Dict[str, Any]): Raw product texts keyed like the object returned by HARVEST_JS.
 
-                # Extract review body (text of the review)
-                review_body_element = safe_find_element(review, By.XPATH, ".//p[contains(@class, 'text-base') and contains(@class, 'text-gray-900')]")
-                review_data["Review Body"] = review_body_element.text if review_body_element else "No review text"
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing the product details, or None if the page has no product title.
+    """
+    if not data or not data["title"]:  # No product on this page
+        return None
 
-                # Extract review checksum (unique identifier)
-                checksum_element = safe_find_element(review, By.XPATH, ".//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]")
-                review_data["Review Checksum"] = checksum_element.text if checksum_element else "No Checksum"
+    row = {}
+    row["Product Title"] = data["title"]
+    row["Price"] = data["price"] or "Price Unavailable"
+    row["Categories"] = data["categories"]
+    row["Product Image URLs"] = data["images"]
+    row["Description"] = data["description"] or "No Description Available"
+    row["Overall Rating"], row["Total Reviews"] = parse_overall_rating(data["rating"])
+    row["Inventory Status"] = data["stockStatus"] or "Stock Status Unavailable"
+    row["Inventory Stock Available"] = parse_stock_availability(data["stockStatus"], data["stockQuantity"])
+    row["SKU"] = data["sku"].replace("SKU: ", "") if data["sku"] else "SKU Unavailable"
+    row["Product Checksum"] = data["checksum"] or "N/A"
+    row["Customer Reviews"] = build_reviews(data["reviews"])
+    return row
+
+
+def harvest_product(driver: webdriver.Chrome):
+    """
+    Extract every product field in a single round-trip by running HARVEST_JS in the page.
 
-                reviews.append(review_data)  # Add the review data to the list
+    Args:
+        driver (webdriver.Chrome): Active Selenium WebDriver instance with the product page loaded.
 
-            except Exception as review_error:
-                # Log any errors encountered while processing individual reviews, but continue with the next review
-                logging.error(f"Error processing individual review: {review_error}")
-                continue
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing the product details, or None if the page has no product title.
 
-        return reviews  # Return the list of extracted reviews
+    Raises:
+        WebDriverException: If the harvest script fails to run in the page.
+    """
+    return build_product(driver.execute_script(HARVEST_JS))  # One WebDriver command for the whole page
 
-    except Exception as e:
-        # Log any errors that occur during the review extraction process
-        logging.error(f"Comprehensive error in review extraction: {e}")
-        return reviews  # Return the reviews list (could be empty if extraction fails)
 
+# Runs of HTML whitespace, which the browser renders as a single space
+_RE_HTML_SPACE = re.compile(r'[ \t\n\r\f]+')
+_RE_SPACES = re.compile(r' {2,}')
+
+# Line breaks the browser's innerText puts around block-level elements (two around paragraphs, for their margins)
+_BLOCK_LINE_BREAKS = dict.fromkeys(
+    ('address', 'article', 'aside', 'blockquote', 'dd', 'details', 'dialog', 'div', 'dl', 'dt', 'fieldset',
+     'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+     'nav', 'ol', 'pre', 'section', 'summary', 'table', 'tr', 'ul'), 1)
+_BLOCK_LINE_BREAKS['p'] = 2
 
-def scrape_product(driver: webdriver.Chrome, product_id: int):
+# Elements the browser never renders
+_UNRENDERED_TAGS = {'head', 'script', 'style', 'template', 'noscript'}
+_RE_DISPLAY_NONE = re.compile(r'display\s*:\s*none')
+
+
+def _is_hidden(element: Any):
+    """Return whether an lxml element is hidden by its own markup (tag, hidden attribute or inline display:none)."""
+    return (element.tag in _UNRENDERED_TAGS
+            or element.get('hidden') is not None
+            or bool(_RE_DISPLAY_NONE.search(element.get('style') or '')))
+
+
+def _collect_text(element: Any, items: List[Any]):
+    """Append the text runs (str) and required line breaks (int) of an lxml element and its visible descendants."""
+    line_breaks = _BLOCK_LINE_BREAKS.get(element.tag, 0)
+    items.append(line_breaks)
+    if element.tag == 'br':
+        items.append('\n')
+    if element.text:
+        items.append(_RE_HTML_SPACE.sub(' ', element.text))
+    for child in element:
+        if isinstance(child.tag, str) and not _is_hidden(child):  # Comments have a non-string tag
+            _collect_text(child, items)
+        if child.tail:  # Text after a child belongs to this element, even if the child is hidden
+            items.append(_RE_HTML_SPACE.sub(' ', child.tail))
+    items.append(line_breaks)
+
+
+def _node_text(node: Optional[Any]):
     """
-    Scrape product details with comprehensive error handling.
+    Return the text of an lxml node the way the browser's innerText (and so WebElement.text) reports it, or None if there is no node.
+
+    Hidden descendants are skipped, runs of whitespace collapse to a single space, <br> becomes a line break and
+    block-level elements go on their own lines. Only markup-level hiding is seen (unrendered tags, the hidden
+    attribute and inline display:none); visibility set by stylesheets or utility classes (invisible, sm:hidden,
+    hidden md:block) needs the page's CSS and viewport, so such text is kept here even where the browser drops it.
+    """
+    if node is None:
+        return None
+
+    items = []
+    _collect_text(node, items)
+
+    text = []
+    pending_breaks = 0
+    for item in items:
+        if isinstance(item, int):
+            pending_breaks = max(pending_breaks, item)  # Adjacent block boundaries share their line breaks
+        elif item:
+            if text and pending_breaks:  # Line breaks at the very start are trimmed
+                text.append('\n' * pending_breaks)
+            pending_breaks = 0
+            text.append(item)
+
+    # Spaces next to line breaks are not rendered
+    return '\n'.join(_RE_SPACES.sub(' ', line).strip(' ') for line in ''.join(text).split('\n')).strip()  # Like the String.trim() HARVEST_JS applies
+
+
+def _first(nodes: List[Any]):
+    """Return the first node of an XPath result, or None if it is empty."""
+    return nodes[0] if nodes else None
+
+
+def _has_classes(*classes: str):
+    """Return an XPath test that, like a CSS class selector, requires every class as a whole token of @class."""
+    return " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in classes)
+
+
+# XPaths used to parse product page HTML with lxml, compiled once at import. They match exactly what the
+# selectors of HARVEST_JS match: class selectors test whole class tokens, [class="..."] the whole attribute.
+_XP_REVIEWS = etree.XPath(f"//div[{_has_classes('border-b', 'border-gray-200', 'pb-8')}]")
+_XP_REVIEW_FIELDS = {
+    "reviewerInfo": etree.XPath(".//p[@class='text-sm text-gray-500']"),
+    "title": etree.XPath(".//p[@class='ml-3 text-sm font-medium text-gray-900']"),
+    "dateText": etree.XPath("(.//p)[position() = last() and position() > 1]"),  # The last <p> holds the date
+    "body": etree.XPath(f".//p[{_has_classes('text-base', 'text-gray-900')}]"),
+    "checksum": etree.XPath(f".//code[{_has_classes('text-xs', 'font-mono')}]")
+}
+_XP_REVIEW_STARS = etree.XPath(f"count(.//svg[{_has_classes('text-yellow-400')}])")  # Counted by libxml2, returns a float
+_XP_PRODUCT_FIELDS = {
+    "title": etree.XPath(f"//h1[{_has_classes('text-3xl', 'font-bold')}]"),
+    "price": etree.XPath(f"//p[{_has_classes('text-3xl', 'tracking-tight', 'text-gray-900')}]"),
+    "description": etree.XPath("//p[@class='text-base text-gray-700']"),
+    "rating": etree.XPath("//div[@class='flex items-center']/p[@class='ml-3 text-sm text-gray-700']"),
+    # HARVEST_JS matches this class as a substring too, and any of the div's own text nodes
+    "stockStatus": etree.XPath("//div[contains(@class, 'inline-flex items-center') and text()[contains(., 'In stock') or contains(., 'Out of stock')]]"),
+    "stockQuantity": etree.XPath(f"//p[{_has_classes('ml-2', 'text-sm', 'text-gray-500')}]"),
+    "sku": etree.XPath("//p[@class='text-sm text-gray-500']"),
+    "checksum": etree.XPath(f"//code[{_has_classes('text-xs', 'font-mono')}]")
+}
+_XP_CATEGORIES = etree.XPath(f"//a[{_has_classes('bg-primary-100', 'text-primary-800')}]")
+_XP_IMAGES = etree.XPath("//img[@class='h-full w-full object-cover object-center']/@src")
+
+
+def parse_product_html(html: str, url: str):
+    """
+    Parse the HTML of a product page with lxml, matching the same elements and texts as HARVEST_JS.
+
+    Works on both the server-rendered HTML fetched over HTTP and the rendered page source of a browser.
+
+    Args:
+        html (str): HTML source of the product page.
+        url (str): URL the page was fetched from, used to resolve relative image URLs.
+
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing the product details, or None if the page has no product title.
+    """
+    tree = lxml.html.fromstring(html, base_url=url)
+    tree.make_links_absolute()
+
+    reviews = []
+    for review in _XP_REVIEWS(tree):
+        raw_review = {field: _node_text(_first(xpath(review))) for field, xpath in _XP_REVIEW_FIELDS.items()}
+        raw_review["stars"] = int(_XP_REVIEW_STARS(review))
+        reviews.append(raw_review)
+
+    data = {field: _node_text(_first(xpath(tree))) for field, xpath in _XP_PRODUCT_FIELDS.items()}
+    data["categories"] = [_node_text(category) for category in _XP_CATEGORIES(tree)]
+    data["images"] = _XP_IMAGES(tree)
+    data["reviews"] = reviews
+    return build_product(data)
+
+
+def _response_version(response: requests.Response):
+    """Return the version of a page from its response headers: the ETag, or Last-Modified if there is no ETag (None if neither)."""
+    return response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+
+def fetch_page_html(url: str, session: Optional[requests.Session] = None):
+    """
+    Fetch the HTML of a page over plain HTTP, along with the version of the page it is.
+
+    Args:
+        url (str): URL of the page.
+        session (Optional[requests.Session]): HTTP session to fetch the page with. Defaults to the module's pooled SESSION.
+
+    Returns:
+        Tuple[str, Optional[str]]: HTML source of the page, and its version (see _response_version).
+
+    Raises:
+        ProductNotFoundError: If the site answers 404.
+        ScraperError: If the site answers with any other non-200 status.
+    """
+    response = (session or SESSION).get(url, timeout=10)
+    if response.status_code == 404:
+        raise ProductNotFoundError(f"Page {url} does not exist (HTTP 404)")
+    if response.status_code != 200:
+        raise ScraperError(f"HTTP {response.status_code} while fetching {url}")
+    return response.text, _response_version(response)
+
+
+def fetch_product(product_id: int, session: Optional[requests.Session] = None):
+    """
+    Scrape product details over plain HTTP without starting a browser.
 
     Args:
-        driver (webdriver.Chrome): Active Selenium WebDriver instance used to interact with the webpage.
         product_id (int): Product ID to scrape from the product page.
+        session (Optional[requests.Session]): HTTP session to fetch the page with. Defaults to the module's pooled SESSION.
 
     Returns:
-        Optional[Dict[str, Any]]: A dictionary containing product details such as title, price, categories, image URLs, etc.,
-        or None if an error occurs during scraping.
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: A dictionary containing the product details, or None if the
+        page could not be fetched or does not contain the product in its server-rendered HTML; and the version of
+        the fetched page (None if unknown).
+
+    Raises:
+        ProductNotFoundError: If the site answers 404, so there is no point trying a browser either.
     """
-    url = f"https://hiring-xry4.onrender.com/products/{product_id}"  # Construct the product page URL
+    url = PRODUCT_URL.format(product_id)  # Construct the product page URL
 
     try:
-        driver.get(url)  # Load the product page
-        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.XPATH, "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]")))  # Wait for product title to load
-        logging.info(f"Scraping details from: {url}")  # Log the URL being scraped
+        html, version = fetch_page_html(url, session)
+        row = parse_product_html(html, url)
+        if row:
+            logging.info(f"Scraped details over HTTP from: {url}")  # Log the URL that was scraped
+        return row, version
 
-        # Check if the page contains product titles (i.e., product exists on page)
-        product_titles = safe_find_elements(
-            driver,
-            By.XPATH,
-            "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]"
-        )
+    except ProductNotFoundError:
+        raise
 
-        if not product_titles:  # If no product found, return None
-            logging.warning(f"No product found on page {product_id}")
-            return None
+    except Exception as e:
+        logging.warning(f"HTTP scrape failed for product {product_id}: {e}")
+        return None, None
 
-        # Initialize a dictionary to store scraped product data
-        row = {}
 
-        # Scrape the product title with a fallback value
-        row["Product Title"] = safe_find_element(
-            driver,
-            By.XPATH,
-            "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]"
-        ).text if safe_find_element(driver, By.XPATH, "//h1[contains(@class, 'text-3xl') and contains(@class, 'font-bold')]") else "Untitled Product"
+def extract_product_fields(driver: webdriver.Chrome):
+    """
+    Extract the product details field by field with individual WebDriver lookups.
 
-        # Scrape the product price with a fallback value
-        row["Price"] = safe_find_element(
-            driver,
-            By.XPATH,
-            "//p[contains(@class, 'text-3xl') and contains(@class, 'tracking-tight') and contains(@class, 'text-gray-900')]"
-        ).text if safe_find_element(driver, By.XPATH, "//p[contains(@class, 'text-3xl') and contains(@class, 'tracking-tight') and contains(@class, 'text-gray-900')]") else "Price Unavailable"
+    This is the slower fallback for when harvest_product cannot run its script in the page.
 
-        # Scrape product categories
-        row["Categories"] = [category.text for category in safe_find_elements(
-            driver,
-            By.XPATH,
-            "//a[contains(@class, 'bg-primary-100') and contains(@class, 'text-primary-800')]"
-        )]
-
-        # Scrape product image URLs
-        row["Product Image URLs"] = [
-            img.get_attribute('src')
-            for img in safe_find_elements(
-                driver,
-                By.XPATH,
-                "//img[@class='h-full w-full object-cover object-center']"
-            )
-        ]
+    Args:
+        driver (webdriver.Chrome): Active Selenium WebDriver instance with the product page loaded.
 
-        # Scrape product description with fallback value
-        row["Description"] = safe_find_element(
-            driver,
-            By.XPATH,
-            "//p[@class='text-base text-gray-700']"
-        ).text if safe_find_element(driver, By.XPATH, "//p[@class='text-base text-gray-700']") else "No Description Available"
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing the product details, or None if the page has no product title.
+    """
+    # Find the product title; without one the page has no product
+    title_element = safe_find_element(
+        driver,
+        By.CSS_SELECTOR,
+        TITLE_SELECTOR
+    )
 
-        # Scrape overall rating and total reviews
-        overall_rating_element = safe_find_element(
-            driver,
-            By.XPATH,
-            "//div[@class='flex items-center']/p[@class='ml-3 text-sm text-gray-700']"
-        )
-        row["Overall Rating"], row["Total Reviews"] = extract_overall_rating(overall_rating_element)
+    if not title_element:  # If no product found, return None
+        return None
 
-        # Scrape stock availability and status
-        stock_status_element = safe_find_element(
-            driver,
-            By.XPATH,
-            "//div[contains(@class, 'inline-flex items-center') and (contains(text(), 'In stock') or contains(text(), 'Out of stock'))]"
-        )
-        row["Inventory Status"] = stock_status_element.text if stock_status_element else "Stock Status Unavailable"
-        row["Inventory Stock Available"] = extract_stock_availability(driver)
+    # Initialize a dictionary to store scraped product data
+    row = {}
 
-        # Scrape SKU information
-        sku_element = safe_find_element(
-            driver,
-            By.XPATH,
-            "//p[@class='text-sm text-gray-500']"
-        )
-        row["SKU"] = sku_element.text.replace("SKU: ", "") if sku_element else "SKU Unavailable"
+    # Scrape the product title
+    row["Product Title"] = title_element.text
+
+    # Scrape the product price with a fallback value
+    row["Price"] = text_or(driver, By.CSS_SELECTOR, PRICE_SELECTOR, "Price Unavailable")
 
-        # Scrape product checksum (unique identifier)
-        checksum_elements = safe_find_elements(
+    # Scrape product categories
+    row["Categories"] = [category.text for category in safe_find_elements(
+        driver,
+        By.CSS_SELECTOR,
+        CATEGORY_SELECTOR
+    )]
+
+    # Scrape product image URLs
+    row["Product Image URLs"] = [
+        img.get_attribute('src')
+        for img in safe_find_elements(
             driver,
-            By.XPATH,
-            "//code[contains(@class, 'text-xs') and contains(@class, 'font-mono')]"
+            By.CSS_SELECTOR,
+            IMAGE_SELECTOR
         )
-        row["Product Checksum"] = checksum_elements[0].text if checksum_elements else "N/A"
+    ]
+
+    # Scrape product description with fallback value
+    row["Description"] = text_or(driver, By.CSS_SELECTOR, DESCRIPTION_SELECTOR, "No Description Available")
+
+    # Scrape overall rating and total reviews
+    row["Overall Rating"], row["Total Reviews"] = parse_overall_rating(
+        text_or(driver, By.CSS_SELECTOR, RATING_SELECTOR, None)
+    )
+
+    # Scrape stock availability and status
+    stock_status_text = text_or(driver, By.XPATH, STOCK_STATUS_XPATH, None)
+    row["Inventory Status"] = stock_status_text or "Stock Status Unavailable"
+    row["Inventory Stock Available"] = extract_stock_availability(driver, stock_status_text)
+
+    # Scrape SKU information
+    row["SKU"] = text_or(driver, By.CSS_SELECTOR, SKU_SELECTOR, "SKU Unavailable").replace("SKU: ", "")
+
+    # Scrape product checksum (unique identifier)
+    checksum_elements = safe_find_elements(
+        driver,
+        By.CSS_SELECTOR,
+        CHECKSUM_SELECTOR
+    )
+    row["Product Checksum"] = checksum_elements[0].text if checksum_elements else "N/A"
+
+    # Scrape customer reviews
+    row["Customer Reviews"] = extract_reviews(driver)
+
+    return row  # Return the dictionary with all scraped product details
+
+
+def product_page_missing(url: str, session: Optional[requests.Session] = None):
+    """
+    Check with a quick HEAD request whether the site reports a product page as missing.
+
+    Args:
+        url (str): URL of the product page.
+        session (Optional[requests.Session]): HTTP session to send the request with. Defaults to the module's pooled SESSION.
+
+    Returns:
+        bool: True if the site answers 404, False otherwise (including when the check itself fails).
+    """
+    try:
+        return (session or SESSION).head(url, timeout=3, allow_redirects=True).status_code == 404
+    except Exception as e:
+        logging.warning(f"HEAD request failed for {url}: {e}")
+        return False  # Let the browser find out instead
+
+
+def page_version(url: str, session: Optional[requests.Session] = None):
+    """
+    Identify the current version of a page with a quick HEAD request, so unchanged pages don't need scraping again.
+
+    Args:
+        url (str): URL of the page.
+        session (Optional[requests.Session]): HTTP session to send the request with. Defaults to the module's pooled SESSION.
+
+    Returns:
+        Optional[str]: The page's ETag, or its Last-Modified date if it has no ETag. None if the site sends neither
+        or the request fails.
+
+    Raises:
+        ProductNotFoundError: If the site answers 404.
+    """
+    try:
+        response = (session or SESSION).head(url, timeout=5, allow_redirects=True)
+    except Exception as e:
+        logging.warning(f"HEAD request failed for {url}: {e}")
+        return None
+
+    if response.status_code == 404:
+        raise ProductNotFoundError(f"Page {url} does not exist (HTTP 404)")
+    if response.status_code != 200:
+        return None
+    return _response_version(response)
+
+
+def scrape_product(driver: webdriver.Chrome, product_id: int, check_exists: bool = True,
+                   session: Optional[requests.Session] = None):
+    """
+    Scrape product details with comprehensive error handling.
+
+    Args:
+        driver (webdriver.Chrome): Active Selenium WebDriver instance used to interact with the webpage.
+        product_id (int): Product ID to scrape from the product page.
+        check_exists (bool): Whether to skip the page without loading it when a HEAD request returns 404. Defaults to True.
+        session (Optional[requests.Session]): HTTP session for the HEAD request. Defaults to the module's pooled SESSION.
 
-        # Scrape customer reviews
-        row["Customer Reviews"] = extract_reviews(driver)
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing product details such as title, price, categories, image URLs, etc.,
+        or None if an error occurs during scraping.
+
+    Raises:
+        WebDriverException: If the browser itself fails (other than a timeout), so the caller can check whether its
+            session is still usable.
+    """
+    url = PRODUCT_URL.format(product_id)  # Construct the product page URL
+
+    try:
+        # Don't wait for the title timeout on pages the site already reports as missing
+        if check_exists and product_page_missing(url, session):
+            logging.warning(f"No product found on page {product_id}")
+            return None
+
+        driver.get(url)  # Load the product page
+        clear_element_cache()  # Lookups cached for the previous page no longer apply
+        WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(EC.presence_of_element_located((By.CSS_SELECTOR, TITLE_SELECTOR)))  # Wait for product title to load
+        logging.info(f"Scraping details from: {url}")  # Log the URL being scraped
+
+        try:
+            # Extract all fields with a single script
+            row = harvest_product(driver)
+        except WebDriverException as e:
+            # If the script fails, parse the rendered page source locally in a single round-trip, and only
+            # look up each field separately through the driver if that finds no product either
+            logging.warning(f"Page harvest failed for product {product_id}, parsing the page source instead: {e}")
+            row = parse_product_html(driver.page_source, url) or extract_product_fields(driver)
+
+        if not row:  # If no product found, return None
+            logging.warning(f"No product found on page {product_id}")
+            return None
 
         return row  # Return the dictionary with all scraped product details
 
@@ -405,6 +928,9 @@ def scrape_product(driver: webdriver.Chrome, product_id: int):
         print(f"Error: No product found on page {product_id}")
         return None  # Return None if the page load times out
 
+    except WebDriverException:
+        raise  # The browser may have crashed; let the DriverPool decide whether to replace it
+
     except Exception as e:
         # Handle unexpected errors and log the stack trace
         logging.error(f"Unexpected error processing product ID {product_id}: {e}")
@@ -412,22 +938,205 @@ def scrape_product(driver: webdriver.Chrome, product_id: int):
         return None  # Return None if any other unexpected error occurs
 
 
+class DriverPool:
+    """
+    Thread-safe pool of WebDrivers shared by the scraping threads.
+
+    Browsers are only started when a page actually needs one, and each is restarted after batch_size
+    pages so long-running browsers don't keep growing in memory. Each slot keeps its own Chrome profile in a
+    temporary directory created for the pool, so a restarted browser starts with the previous one's HTTP disk
+    cache. The directory is unique to the pool, as Chrome locks a profile against use by any other browser,
+    and it is removed when the pool is closed.
+    """
+
+    def __init__(self, headless: bool = True, size: int = 4, batch_size: int = 25):
+        """
+        Args:
+            headless (bool): Whether the browsers run in headless mode. Defaults to True.
+            size (int): Maximum number of browsers running at the same time. Defaults to 4.
+            batch_size (int): Number of pages scraped with a browser before it is restarted. Defaults to 25.
+        """
+        self.headless = headless
+        self.batch_size = batch_size
+        self._profile_root = tempfile.mkdtemp(prefix='chrome_scrape_profiles-')
+        self._slots = queue.Queue()  # Each slot holds (profile directory, driver or None, pages scraped with it)
+        for slot in range(size):
+            self._slots.put((os.path.join(self._profile_root, f'slot{slot}'), None, 0))
+
+    @contextmanager
+    def driver(self):
+        """
+        Borrow a WebDriver for the duration of a with block, waiting for a free slot if all browsers are busy.
+
+        Yields:
+            webdriver.Chrome: A Chrome WebDriver used by no other thread until the block exits
+
+        Raises:
+            ScraperError: If WebDriver setup fails
+        """
+        profile_dir, driver, uses = self._slots.get()
+        try:
+            if driver is None:
+                driver, uses = setup_webdriver(self.headless, profile_dir=profile_dir), 0
+            try:
+                yield driver
+            except WebDriverException:
+                if not self._is_alive(driver):  # Don't hand a crashed browser to the next thread
+                    logging.warning("Browser session is no longer usable, it will be replaced")
+                    uses = self.batch_size
+                raise
+            finally:
+                uses += 1
+                if uses >= self.batch_size:  # Restart the browser once it has scraped a full batch (or died)
+                    self._quit(driver)
+                    driver, uses = None, 0
+        finally:
+            self._slots.put((profile_dir, driver, uses))  # Hand the slot back to the next thread
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome):
+        """Return whether a WebDriver's browser session still answers commands."""
+        try:
+            driver.current_url  # Cheap command that fails once the session is gone
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        """Quit a WebDriver session, closing the browser; a browser that already died is only logged."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Failed to quit browser: {e}")
+
+    def close(self):
+        """Quit every browser in the pool and remove their profiles. Call this once no thread is using the pool any more."""
+        while not self._slots.empty():
+            _, driver, _ = self._slots.get()
+            if driver:
+                self._quit(driver)
+        shutil.rmtree(self._profile_root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_manifest(manifest_file: str):
+    """
+    Index the manifest written by a previous run, without keeping the products themselves in memory.
+
+    The manifest has one JSON object per line: {"id": product ID, "version": page version, "product": product details}.
+
+    Args:
+        manifest_file (str): Path of the manifest file.
+
+    Returns:
+        Dict[int, Tuple[str, int]]: The page version and the byte offset of the product's line in the manifest,
+        keyed by product ID. Empty if there is no manifest or it can't be read.
+    """
+    index = {}
+    try:
+        with open(manifest_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                entry = orjson.loads(line)
+                index[entry["id"]] = (entry["version"], offset)
+                offset += len(line)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable manifest {manifest_file}, every product will be scraped: {e}")
+        return {}
+    return index
+
+
+def read_manifest_product(manifest_file: str, offset: int):
+    """
+    Read back one product from the manifest written by a previous run.
+
+    Args:
+        manifest_file (str): Path of the manifest file.
+        offset (int): Byte offset of the product's line, as indexed by load_manifest.
+
+    Returns:
+        Dict[str, Any]: The product details stored on that line.
+    """
+    with open(manifest_file, 'rb') as f:
+        f.seek(offset)
+        return orjson.loads(f.readline())["product"]
+
+
+def _scrape_one(product_id: int, drivers: DriverPool, manifest_file: Optional[str] = None,
+                manifest: Optional[Dict[int, Any]] = None, session: Optional[requests.Session] = None):
+    """
+    Scrape a single product on a worker thread.
+
+    When the manifest of a previous run has the product, a HEAD request checks whether its page changed since;
+    if not, the stored product is reused. Otherwise the page is fetched over plain HTTP first, and a browser is
+    only borrowed from the pool when the product is missing from the server-rendered HTML.
+
+    Args:
+        product_id (int): Product ID to scrape.
+        drivers (DriverPool): Pool to borrow a WebDriver from when one is needed.
+        manifest_file (Optional[str]): Path of the previous run's manifest. None to always scrape.
+        manifest (Optional[Dict[int, Any]]): Index of that manifest, as returned by load_manifest.
+        session (Optional[requests.Session]): HTTP session for every request. Defaults to the module's pooled SESSION.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: The scraped product details (or None if scraping failed),
+        and the version of the page they were scraped from (None if unknown).
+    """
+    try:
+        cached = manifest.get(product_id) if manifest_file and manifest else None
+        if cached:
+            version = page_version(PRODUCT_URL.format(product_id), session)
+            if version and version == cached[0]:
+                logging.info(f"Product {product_id} is unchanged since the last run, reusing it")
+                return read_manifest_product(manifest_file, cached[1]), version
+
+        row, version = fetch_product(product_id, session)
+        if row:
+            return row, version
+
+        with drivers.driver() as driver:
+            # The HTTP fetch already checked that the page exists, so skip scrape_product's own check
+            return scrape_product(driver, product_id, check_exists=False), version
+    except ProductNotFoundError as e:
+        logging.warning(str(e))  # Missing products are skipped without touching a browser
+        return None, None
+    except Exception as e:
+        logging.error(f"Error scraping product {product_id}: {e}")  # Log errors for the specific product
+        return None, None
+
+
 #                                  #range start is inclusive, range end is exclusive
-def main(product_id_range: range = range(1, 52), output_file: str = 'products1.json', headless: bool = True): 
+def main(product_id_range: range = range(1, 52), output_file: str = 'products1.json', headless: bool = True, workers: int = 16, browsers: int = 4, batch_size: int = 25,
+         manifest_file: Optional[str] = None, session: Optional[requests.Session] = None): 
     """
     Main function to scrape product data with comprehensive error handling.
 
     Key Responsibilities:
-        - Initialize WebDriver
-        - Iterate through product IDs
+        - Start a pool of worker threads sharing one HTTP session and a pool of WebDrivers
+        - Scrape product IDs in parallel across the threads
         - Handle scraping errors
         - Generate detailed JSON output
         - Track and log scraping statistics
 
     Arguments Passed:
         product_id_range (range): Range of product IDs to scrape. Defaults to range(1, 52).
-        output_file (str): Output JSON file name. Defaults to 'products1.json'.
+        output_file (str): Output JSON file name; a '.jsonl' name writes one product per line. Defaults to 'products1.json'.
         headless (bool): Whether to run the browser in headless mode. Defaults to True.
+        workers (int): Number of worker threads scraping in parallel. Defaults to 16.
+        browsers (int): Maximum number of browsers for pages that can't be scraped over plain HTTP. Defaults to 4.
+        batch_size (int): Number of products each browser scrapes before it is restarted. Defaults to 25.
+        manifest_file (Optional[str]): JSON Lines file remembering each product and the version (ETag) of its page between
+            runs, so unchanged products are not scraped again. Defaults to None, which always scrapes every product.
+        session (Optional[requests.Session]): HTTP session shared by the worker threads; it should have a connection pool
+            at least as large as workers. Defaults to the module's pooled SESSION.
     """
     # Configure logging
     logging.basicConfig(
@@ -444,32 +1153,59 @@ def main(product_id_range: range = range(1, 52), output_file: str = 'products1.j
     total_successful = 0  # Total number of products successfully scraped
     failed_products = []  # List to track failed product IDs
 
-    driver = None
     try:
-        # Initialize WebDriver
-        driver = setup_webdriver(headless)
-
-        # Final container for Scraped data that will be saved to JSON later
-        data = []
-
-        # Iterate through product IDs that were passed as arguments above
-        for id in product_id_range: 
-            total_attempted += 1  # Increment the attempted counter
-            try:
-                # Scrape product data for the current product ID
-                product_data = scrape_product(driver, id)
+        # Resolve the chromedriver once here so the threads don't each consult webdriver_manager
+        try:
+            get_driver_path()
+        except Exception as e:
+            logging.warning(f"Could not resolve chromedriver up front, it will be retried if a browser is needed: {e}")
+
+        # Index the products scraped by the previous run along with the versions of their pages. The new manifest
+        # is streamed to a temporary file next to it, so the previous one stays readable until the run is done.
+        manifest = load_manifest(manifest_file) if manifest_file else None
+        new_manifest_file = f"{manifest_file}.tmp" if manifest_file else os.devnull
+
+        # Scrape the product IDs in parallel; executor.map yields the results in product ID order as they finish
+        with DriverPool(headless, browsers, batch_size) as drivers, \
+                ThreadPoolExecutor(max_workers=workers) as executor, \
+                open(output_file, 'wb') as json_file, \
+                open(new_manifest_file, 'wb') as manifest_out:
+            # Stream each product out as soon as it is scraped instead of holding them all in memory:
+            # one compact object per line for .jsonl files, otherwise an indented JSON array
+            json_lines = output_file.endswith('.jsonl')
+            if not json_lines:
+                json_file.write(b'[\n')
+            first = True
+            results = executor.map(lambda product_id: _scrape_one(product_id, drivers, manifest_file, manifest, session), product_id_range)
+            for id, (product_data, version) in zip(product_id_range, results):
+                total_attempted += 1  # Increment the attempted counter
+                if manifest_file and product_data and version:  # Products without a known version are scraped again next time
+                    manifest_out.write(orjson.dumps({"id": id, "version": version, "product": product_data},
+                                                    option=orjson.OPT_APPEND_NEWLINE))
                 if product_data:
-                    data.append(product_data)  # Add successfully scraped data to the list
+                    if json_lines:
+                        json_file.write(orjson.dumps(product_data, option=orjson.OPT_APPEND_NEWLINE))
+                    else:
+                        if not first:
+                            json_file.write(b',\n')
+                        product_json = orjson.dumps(product_data, option=orjson.OPT_INDENT_2)
+                        json_file.write(b'  ' + product_json.replace(b'\n', b'\n  '))  # Write the product, indented as an array item
+                    first = False
                     total_successful += 1  # Increment successful counter
                 else:
                     failed_products.append(id)  # Add failed product ID to the list
-            except Exception as e:
-                logging.error(f"Error scraping product {id}: {e}")  # Log errors for the specific product
-                failed_products.append(id)  # Add failed product ID to the list
+            if not json_lines:
+                json_file.write(b'\n]')
 
-        # Save scraped data to a JSON file
-        with open(output_file, 'w') as json_file:
-            json.dump(data, json_file, indent=4)  # Write the data to the JSON file
+            # Carry over the previous run's entries for products outside this run's range
+            if manifest:
+                with open(manifest_file, 'rb') as f:
+                    for line in f:
+                        if orjson.loads(line)["id"] not in product_id_range:
+                            manifest_out.write(line)
+
+        if manifest_file:
+            os.replace(new_manifest_file, manifest_file)  # Replace the previous manifest only once the run is complete
 
         # Log scraping statistics
         logging.info(f"Scraping complete")
@@ -483,11 +1219,6 @@ def main(product_id_range: range = range(1, 52), output_file: str = 'products1.j
         logging.error(f"An unexpected error occurred during scraping: {e}")
         logging.error(traceback.format_exc())  # Log the full traceback for debugging
 
-    finally:
-        # Ensure the WebDriver is properly closed at the end of the process
-        if driver:
-            driver.quit()  # Quit the WebDriver session, closing the browser
-
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 import json
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render to files without loading a GUI toolkit; must be set before importing pyplot
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -17,24 +19,26 @@ print(df['Product Title']) # Print all product titles from the DataFrame
 
 # Cleaning and analyzing prices
 print("\nPrice Statistics:")
-df['Price'] = df['Price'].str.replace('$', '').astype(float) # Remove dollar sign and convert to float to clean for analysis
+df['Price'] = df['Price'].str.extract(r'(\d[\d,]*(?:\.\d+)?)', expand=False).str.replace(',', '', regex=False).astype('float32') # Pull the number out of the price text, dropping thousands separators ('Price Unavailable' becomes NaN)
 print(df['Price'].describe()) # Print descriptive statistics of product prices
 
 # Analyze categories
 print("\nCategories:")
-all_categories = [cat for cats in df['Categories'] for cat in cats] # Extract all categories from nested lists and create a Series
-print(pd.Series(all_categories).value_counts()) # Count the number of products in each category
-category_counts = pd.Series(all_categories).value_counts()  # Count the number of products in each category
+category_counts = df['Categories'].explode().value_counts()  # Flatten the category lists and count the number of products in each category
+print(category_counts)
 
 # Analyze ratings
 print("\nOverall Ratings:")
-# Extract the rating value (before the slash) and convert to float
-df['Rating'] = df['Overall Rating'].str.split('/').str[0].astype(float)
+# Extract the rating value (before the slash) and convert to float ('N/A' becomes NaN)
+df['Rating'] = df['Overall Rating'].str.extract(r'^(\d+(?:\.\d+)?)', expand=False).astype('float32')
 print(df['Rating'].describe()) # Print descriptive statistics of overall ratings
 
-# Analyze reviews -- # Combine all reviews from each product into a single list
-all_reviews = [review for product in data for review in product['Customer Reviews']]
-review_df = pd.DataFrame(all_reviews)
+# Analyze reviews -- # Combine all reviews from each product into a single DataFrame
+review_df = pd.json_normalize(data, record_path='Customer Reviews')
+# Repeated labels are stored as categories so counting works on integer codes instead of strings
+review_df['Name'] = review_df['Name'].astype('category')
+review_df['Rating'] = review_df['Rating'].astype('category')  # Keep the 'x/5 Stars' labels for the printout and pie chart
+review_df['Date'] = pd.to_datetime(review_df['Date'], format='%m/%d/%Y', errors='coerce')  # 'Unknown Date' becomes NaT
 
 
 print("\nReview Statistics:")
@@ -55,7 +59,8 @@ sns.histplot(df['Price'], kde=True, bins=20)
 plt.title('Distribution of Prices')
 plt.xlabel('Price')
 plt.ylabel('Frequency')
-plt.show()
+plt.savefig('price_distribution.png', dpi=100, bbox_inches='tight')  # Save the plot instead of opening a window
+plt.close()  # Free the figure
 
 
 #Visualize Category Distribution
@@ -65,7 +70,8 @@ plt.title('Distribution of Product Categories')
 plt.xlabel('Category')
 plt.ylabel('Count')
 plt.xticks(rotation=45)  # Rotate x-axis labels for better readability
-plt.show()
+plt.savefig('category_distribution.png', dpi=100, bbox_inches='tight')
+plt.close()
 
 
 # Visualize the distribution of product ratings
@@ -73,11 +79,13 @@ plt.figure(figsize=(8, 8))
 review_df['Rating'].value_counts().plot.pie(autopct='%1.1f%%', startangle=140, colors=sns.color_palette('viridis'))
 plt.title('Distribution of Product Ratings')
 plt.ylabel('')  # Remove the ylabel for a cleaner look
-plt.show()
+plt.savefig('rating_distribution.png', dpi=100, bbox_inches='tight')
+plt.close()
 
 
 # Visualize Most Common Reviewers
 plt.figure(figsize=(10, 6)) # Set figure size for better visualization
 sns.countplot(y=review_df['Name'], order=review_df['Name'].value_counts().iloc[:10].index) # Plot a count plot of the top 10 most common reviewers
 plt.title('Top 10 Most Common Reviewers')
-plt.show() # Display the plot
\ No newline at end of file
+plt.savefig('top_reviewers.png', dpi=100, bbox_inches='tight')
+plt.close()
\ No newline at end of file